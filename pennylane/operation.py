@@ -847,9 +847,9 @@ class Channel(Operation, abc.ABC):
         **Example**
 
         >>> qml.AmplitudeDamping._kraus_matrices(0.1)
-        >>> [array([[1.       , 0.       ],
-        [0.       , 0.9486833]]), array([[0.        , 0.31622777],
-        [0.        , 0.        ]])]
+        [array([[1.       +0.j, 0.       +0.j],
+               [0.       +0.j, 0.9486833+0.j]]), array([[0.        +0.j, 0.31622777+0.j],
+               [0.        +0.j, 0.        +0.j]])]
 
         To return the Kraus matrices of an *instantiated* channel,
         please use the :attr:`~.Operator.kraus_matrices` property instead.
@@ -859,6 +859,125 @@ class Channel(Operation, abc.ABC):
         """
         raise NotImplementedError
 
+    @classmethod
+    def _kraus_matrices_stacked(cls, *params):
+        """Kraus matrices representing a quantum channel, stacked
+        into a single array.
+
+        Simulators that apply all Kraus matrices of a channel at once
+        can use this method to avoid re-stacking the list returned by
+        :meth:`~.Channel._kraus_matrices`. Channels may override it
+        to construct the stacked array directly. Like
+        :meth:`~.Channel._kraus_matrices`, it is only defined for scalar
+        parameters; use :meth:`~.Channel.compute_kraus_batched` for
+        batches of parameter values.
+
+        **Example**
+
+        >>> qml.AmplitudeDamping._kraus_matrices_stacked(0.1).shape
+        (2, 2, 2)
+
+        Returns:
+            array: array of shape ``(n, d, d)`` containing the ``n`` Kraus matrices
+        """
+        return np.stack(cls._kraus_matrices(*params))
+
+    @classmethod
+    def compute_kraus(cls, *params, out=None):
+        """Kraus matrices of the channel for scalar parameters, stacked into a single
+        complex128 array.
+
+        Unlike :meth:`~.Channel._kraus_matrices`, the full set of Kraus matrices
+        is returned, including those that vanish for the given parameters, so that
+        the shape of the result depends only on the channel. The built-in channels
+        construct the matrices using a kernel that is JIT-compiled if Numba is
+        installed, avoiding the Python overhead of :meth:`~.Channel._kraus_matrices`
+        in hot simulation loops.
+
+        The default implementation relies on the presence of the
+        :meth:`~.Channel._kraus_matrices_stacked` method.
+
+        **Example**
+
+        >>> qml.AmplitudeDamping.compute_kraus(0.1).shape
+        (2, 2, 2)
+        >>> qml.AmplitudeDamping.compute_kraus(0).shape
+        (2, 2, 2)
+
+        Args:
+            params (float): channel parameters
+
+        Keyword Args:
+            out (array): C-contiguous complex128 array of shape ``(n, d, d)``
+                to store the result in. If not provided, a new array is allocated.
+
+        Raises:
+            ValueError: if ``out`` does not have the expected shape, dtype or memory layout
+
+        Returns:
+            array: array of shape ``(n, d, d)`` containing the ``n`` Kraus matrices
+        """
+        K = cls._kraus_matrices_stacked(*params)
+
+        if out is None:
+            return np.array(K, dtype=np.complex128)
+
+        cls._check_kraus_buffer(out, K.shape)
+        out[...] = K
+        return out
+
+    @classmethod
+    def compute_kraus_batched(cls, *params):
+        """Kraus matrices of the channel for a batch of parameter values.
+
+        Each parameter may be an array of values; the parameters are broadcast
+        against each other, and the full set of Kraus matrices, as returned by
+        :meth:`~.Channel.compute_kraus`, is computed for every entry of the batch.
+        The built-in channels evaluate the whole batch at once using vectorized
+        NumPy operations, replacing repeated calls in parameter sweeps.
+
+        The default implementation calls :meth:`~.Channel.compute_kraus`
+        for each entry of the batch. For an empty batch, the shape of the
+        Kraus matrices is obtained by evaluating the channel at zero.
+
+        **Example**
+
+        >>> qml.AmplitudeDamping.compute_kraus_batched([0.1, 0.2, 0.3]).shape
+        (3, 2, 2, 2)
+
+        Args:
+            params (array[float]): batches of channel parameters
+
+        Returns:
+            array: array of shape ``batch_shape + (n, d, d)`` containing the
+            Kraus matrices for each entry of the batch
+        """
+        params = np.broadcast_arrays(*[np.asarray(p) for p in params])
+        K = [cls.compute_kraus(*p) for p in zip(*[p.flat for p in params])]
+
+        if not K:
+            shape = cls.compute_kraus(*[0.0] * len(params)).shape
+            return np.empty(params[0].shape + shape, dtype=np.complex128)
+
+        return np.reshape(K, params[0].shape + K[0].shape)
+
+    @staticmethod
+    def _check_kraus_buffer(out, shape):
+        """Checks that an output buffer can hold stacked Kraus matrices.
+
+        Args:
+            out (array): the output buffer
+            shape (tuple[int]): the expected shape of the buffer
+
+        Raises:
+            ValueError: if ``out`` is not a C-contiguous complex128 array of the given shape
+        """
+        if out.shape != shape or out.dtype != np.complex128 or not out.flags.c_contiguous:
+            raise ValueError(
+                "The output array must be a C-contiguous complex128 array "
+                "of shape {}.".format(shape)
+            )
+
     @property
     def kraus_matrices(self):
         r"""Kraus matrices of an instantiated channel
@@ -868,9 +987,9 @@ class Channel(Operation, abc.ABC):
 
         >>> U = qml.AmplitudeDamping(0.1, wires=1)
         >>> U.kraus_matrices
-        >>> [array([[1.       , 0.       ],
-        [0.       , 0.9486833]]), array([[0.        , 0.31622777],
-        [0.        , 0.        ]])]
+        [array([[1.       +0.j, 0.       +0.j],
+               [0.       +0.j, 0.9486833+0.j]]), array([[0.        +0.j, 0.31622777+0.j],
+               [0.        +0.j, 0.        +0.j]])]
 
         Returns:
             list(array): list of Kraus matrices
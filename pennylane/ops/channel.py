@@ -16,10 +16,236 @@ This module contains the available built-in noisy
 quantum channels supported by PennyLane, as well as their conventions.
 """
 
+import functools
+import math
+
 import numpy as np
 
 from pennylane.operation import Channel
 
+# Constant single-qubit matrices used to build the Kraus matrices
+_I2 = np.eye(2, dtype=np.complex128)
+_X = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+_Y = np.array([[0, -1j], [1j, 0]], dtype=np.complex128)
+_Z = np.array([[1, 0], [0, -1]], dtype=np.complex128)
+_PAULIS = np.array([_X, _Y, _Z], dtype=np.complex128)
+
+
+def _sqrt(x):
+    """Square root of a scalar channel parameter.
+
+    Non-negative values are dispatched to :func:`math.sqrt`, avoiding the
+    overhead of the NumPy ufunc machinery. Negative values use :func:`numpy.sqrt`,
+    so that out-of-range parameters passed directly to ``_kraus_matrices``
+    give ``nan`` rather than an error.
+
+    Args:
+        x (float): input value
+
+    Returns:
+        float: the square root of ``x``
+    """
+    if x >= 0:
+        return math.sqrt(x)
+
+    return np.sqrt(x)
+
+
+def _cache_kraus(func):
+    """Memoizes the stacked Kraus matrices of a channel for real scalar parameters.
+
+    Noisy simulations typically apply the same channel with fixed
+    parameter values many times; for hashable ``int`` or ``float`` parameters
+    the Kraus matrices are therefore computed once and stored in a
+    least-recently-used cache. The cached array is made read-only, and so
+    are all views of it, such as the matrices returned by ``_kraus_matrices``;
+    callers that need to modify them should make a copy. Any other parameter
+    types (e.g., arrays or tensors) bypass the cache.
+
+    Args:
+        func (callable): function computing the stacked Kraus matrices
+            from the channel class and its parameters
+
+    Returns:
+        callable: the memoized function
+    """
+
+    @functools.lru_cache(maxsize=128)
+    def cached(cls, *params):
+        K = func(cls, *params)
+        K.flags.writeable = False
+        return K
+
+    @functools.wraps(func)
+    def wrapper(cls, *params):
+        if all(isinstance(p, (int, float)) for p in params):
+            return cached(cls, *params)
+
+        return func(cls, *params)
+
+    return wrapper
+
+
+# The following kernels write the Kraus matrices of a channel, given the square roots
+# appearing in them, into a buffer of shape ``(num_kraus, 2, 2)``. They only use plain
+# indexing, so that they are cheap to call from Python and can be compiled by Numba.
+
+
+def _amplitude_damping_kraus(sg, cg, out):
+    """Writes the Kraus matrices of :class:`AmplitudeDamping` into ``out``."""
+    out[:] = 0
+    out[0, 0, 0] = 1
+    out[0, 1, 1] = cg
+    out[1, 0, 1] = sg
+
+
+def _generalized_amplitude_damping_kraus(sg, cg, sp, cp, out):
+    """Writes the Kraus matrices of :class:`GeneralizedAmplitudeDamping` into ``out``."""
+    out[:] = 0
+    out[0, 0, 0] = sp
+    out[0, 1, 1] = sp * cg
+    out[1, 0, 1] = sp * sg
+    out[2, 0, 0] = cp * cg
+    out[2, 1, 1] = cp
+    out[3, 1, 0] = cp * sg
+
+
+def _phase_damping_kraus(sg, cg, out):
+    """Writes the Kraus matrices of :class:`PhaseDamping` into ``out``."""
+    out[:] = 0
+    out[0, 0, 0] = 1
+    out[0, 1, 1] = cg
+    out[1, 1, 1] = sg
+
+
+def _depolarizing_kraus(c, s, out):
+    """Writes the Kraus matrices of :class:`DepolarizingChannel` into ``out``."""
+    np.multiply(c, _I2, out[0])
+    np.multiply(s, _PAULIS, out[1:])
+
+
+# The batched kernels index the output buffer from the end, so that the leading
+# dimensions of a buffer of shape ``batch_shape + (num_kraus, 2, 2)`` are the batch.
+
+
+def _amplitude_damping_kraus_batched(sg, cg, out):
+    """Writes a batch of Kraus matrices of :class:`AmplitudeDamping` into ``out``."""
+    out[...] = 0
+    out[..., 0, 0, 0] = 1
+    out[..., 0, 1, 1] = cg
+    out[..., 1, 0, 1] = sg
+
+
+def _generalized_amplitude_damping_kraus_batched(sg, cg, sp, cp, out):
+    """Writes a batch of Kraus matrices of :class:`GeneralizedAmplitudeDamping` into ``out``."""
+    out[...] = 0
+    out[..., 0, 0, 0] = sp
+    out[..., 0, 1, 1] = sp * cg
+    out[..., 1, 0, 1] = sp * sg
+    out[..., 2, 0, 0] = cp * cg
+    out[..., 2, 1, 1] = cp
+    out[..., 3, 1, 0] = cp * sg
+
+
+def _phase_damping_kraus_batched(sg, cg, out):
+    """Writes a batch of Kraus matrices of :class:`PhaseDamping` into ``out``."""
+    out[...] = 0
+    out[..., 0, 0, 0] = 1
+    out[..., 0, 1, 1] = cg
+    out[..., 1, 1, 1] = sg
+
+
+def _depolarizing_kraus_batched(c, s, out):
+    """Writes a batch of Kraus matrices of :class:`DepolarizingChannel` into ``out``."""
+    c, s = c[..., np.newaxis, np.newaxis], s[..., np.newaxis, np.newaxis]
+    np.multiply(c, _I2, out[..., 0, :, :])
+    np.multiply(s[..., np.newaxis], _PAULIS, out[..., 1:, :, :])
+
+
+@functools.lru_cache(maxsize=None)
+def _jit(kernel):
+    """Compiles a Kraus kernel using Numba.
+
+    Numba is only imported the first time a kernel is needed, so that it is
+    not loaded on ``import pennylane``. If Numba is not installed, the kernel
+    is returned unchanged and executed as regular NumPy code.
+
+    Args:
+        kernel (callable): kernel writing the Kraus matrices into a buffer
+
+    Returns:
+        callable: the compiled kernel
+    """
+    try:
+        from numba import njit  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return kernel
+
+    return njit(kernel)
+
+
+def _scalar_params(params):
+    """Converts scalar channel parameters to floats.
+
+    Args:
+        params (tuple): channel parameters
+
+    Raises:
+        ValueError: if any of the parameters is not a scalar
+
+    Returns:
+        list[float]: the channel parameters
+    """
+    for p in params:
+        if not isinstance(p, (int, float)) and np.ndim(p) != 0:
+            raise ValueError(
+                "The Kraus matrices can only be computed for scalar parameters; "
+                "use compute_kraus_batched for batches of parameter values."
+            )
+
+    return [float(p) for p in params]
+
+
+def _run_kraus_kernel(kernel, num_kraus, roots, out):
+    """Evaluates a Kraus kernel for scalar channel parameters.
+
+    Args:
+        kernel (callable): kernel writing the Kraus matrices into a buffer
+        num_kraus (int): number of Kraus matrices of the channel
+        roots (tuple[float]): square roots of the channel parameters expected by the kernel
+        out (array or None): complex128 buffer of shape ``(num_kraus, 2, 2)``
+            to write the Kraus matrices into; if ``None``, a new array is allocated
+
+    Returns:
+        array: the Kraus matrices stacked into an array of shape ``(num_kraus, 2, 2)``
+    """
+    if out is None:
+        out = np.empty((num_kraus, 2, 2), dtype=np.complex128)
+    else:
+        Channel._check_kraus_buffer(out, (num_kraus, 2, 2))
+
+    _jit(kernel)(*roots, out)
+    return out
+
+
+def _run_kraus_kernel_batched(kernel, num_kraus, roots):
+    """Evaluates a batched Kraus kernel for arrays of channel parameters.
+
+    Args:
+        kernel (callable): batched kernel writing the Kraus matrices into a buffer
+        num_kraus (int): number of Kraus matrices of the channel
+        roots (tuple[array[float]]): square roots of the channel parameters expected
+            by the kernel, broadcastable against each other
+
+    Returns:
+        array: the Kraus matrices stacked into an array of shape
+        ``batch_shape + (num_kraus, 2, 2)``
+    """
+    roots = np.broadcast_arrays(*roots)
+    out = np.empty(roots[0].shape + (num_kraus, 2, 2), dtype=np.complex128)
+    kernel(*roots, out)
+    return out
+
 
 class AmplitudeDamping(Channel):
     r"""AmplitudeDamping(gamma, wires)
@@ -41,6 +267,7 @@ class AmplitudeDamping(Channel):
                 \end{bmatrix}
 
     where :math:`\gamma \in [0, 1]` is the amplitude damping probability.
+    For :math:`\gamma = 0` the channel is the identity, and only :math:`K_0` is returned.
 
     **Details:**
 
@@ -58,10 +285,31 @@ class AmplitudeDamping(Channel):
 
     @classmethod
     def _kraus_matrices(cls, *params):
+        return list(cls._kraus_matrices_stacked(*params))
+
+    @classmethod
+    @_cache_kraus
+    def _kraus_matrices_stacked(cls, *params):
         gamma = params[0]
-        K0 = np.diag([1, np.sqrt(1 - gamma)])
-        K1 = np.sqrt(gamma) * np.array([[0, 1], [0, 0]])
-        return [K0, K1]
+        K = cls.compute_kraus(*params)
+
+        if gamma == 0:
+            # K_1 vanishes and K_0 is the identity
+            return K[:1].copy()
+
+        return K
+
+    @classmethod
+    def compute_kraus(cls, *params, out=None):
+        gamma = _scalar_params(params)[0]
+        roots = (_sqrt(gamma), _sqrt(1 - gamma))
+        return _run_kraus_kernel(_amplitude_damping_kraus, 2, roots, out)
+
+    @classmethod
+    def compute_kraus_batched(cls, *params):
+        gamma = np.asarray(params[0], dtype=np.float64)
+        roots = (np.sqrt(gamma), np.sqrt(1 - gamma))
+        return _run_kraus_kernel_batched(_amplitude_damping_kraus_batched, 2, roots)
 
 
 class GeneralizedAmplitudeDamping(Channel):
@@ -115,12 +363,24 @@ class GeneralizedAmplitudeDamping(Channel):
 
     @classmethod
     def _kraus_matrices(cls, *params):
-        gamma, p = params
-        K0 = np.sqrt(p) * np.diag([1, np.sqrt(1 - gamma)])
-        K1 = np.sqrt(p) * np.sqrt(gamma) * np.array([[0, 1], [0, 0]])
-        K2 = np.sqrt(1 - p) * np.diag([np.sqrt(1 - gamma), 1])
-        K3 = np.sqrt(1 - p) * np.sqrt(gamma) * np.array([[0, 0], [1, 0]])
-        return [K0, K1, K2, K3]
+        return list(cls._kraus_matrices_stacked(*params))
+
+    @classmethod
+    @_cache_kraus
+    def _kraus_matrices_stacked(cls, *params):
+        return cls.compute_kraus(*params)
+
+    @classmethod
+    def compute_kraus(cls, *params, out=None):
+        gamma, p = _scalar_params(params)
+        roots = (_sqrt(gamma), _sqrt(1 - gamma), _sqrt(p), _sqrt(1 - p))
+        return _run_kraus_kernel(_generalized_amplitude_damping_kraus, 4, roots, out)
+
+    @classmethod
+    def compute_kraus_batched(cls, *params):
+        gamma, p = [np.asarray(q, dtype=np.float64) for q in params]
+        roots = (np.sqrt(gamma), np.sqrt(1 - gamma), np.sqrt(p), np.sqrt(1 - p))
+        return _run_kraus_kernel_batched(_generalized_amplitude_damping_kraus_batched, 4, roots)
 
 
 class PhaseDamping(Channel):
@@ -144,6 +404,7 @@ class PhaseDamping(Channel):
                 \end{bmatrix}
 
     where :math:`\gamma \in [0, 1]` is the phase damping probability.
+    For :math:`\gamma = 0` the channel is the identity, and only :math:`K_0` is returned.
 
     **Details:**
 
@@ -161,10 +422,31 @@ class PhaseDamping(Channel):
 
     @classmethod
     def _kraus_matrices(cls, *params):
+        return list(cls._kraus_matrices_stacked(*params))
+
+    @classmethod
+    @_cache_kraus
+    def _kraus_matrices_stacked(cls, *params):
         gamma = params[0]
-        K0 = np.diag([1, np.sqrt(1 - gamma)])
-        K1 = np.diag([0, np.sqrt(gamma)])
-        return [K0, K1]
+        K = cls.compute_kraus(*params)
+
+        if gamma == 0:
+            # K_1 vanishes and K_0 is the identity
+            return K[:1].copy()
+
+        return K
+
+    @classmethod
+    def compute_kraus(cls, *params, out=None):
+        gamma = _scalar_params(params)[0]
+        roots = (_sqrt(gamma), _sqrt(1 - gamma))
+        return _run_kraus_kernel(_phase_damping_kraus, 2, roots, out)
+
+    @classmethod
+    def compute_kraus_batched(cls, *params):
+        gamma = np.asarray(params[0], dtype=np.float64)
+        roots = (np.sqrt(gamma), np.sqrt(1 - gamma))
+        return _run_kraus_kernel_batched(_phase_damping_kraus_batched, 2, roots)
 
 
 class DepolarizingChannel(Channel):
@@ -199,6 +481,8 @@ class DepolarizingChannel(Channel):
 
     where :math:`p \in [0, 1]` is the depolarization probability and is equally
     divided in the application of all Pauli operations.
+    Kraus matrices that vanish are omitted: for :math:`p = 0` only :math:`K_0`
+    is returned, and for :math:`p = 1` only :math:`K_1`, :math:`K_2` and :math:`K_3`.
 
     **Details:**
 
@@ -216,12 +500,34 @@ class DepolarizingChannel(Channel):
 
     @classmethod
     def _kraus_matrices(cls, *params):
+        return list(cls._kraus_matrices_stacked(*params))
+
+    @classmethod
+    @_cache_kraus
+    def _kraus_matrices_stacked(cls, *params):
         p = params[0]
-        K0 = np.sqrt(1 - p) * np.eye(2)
-        K1 = np.sqrt(p / 3) * np.array([[0, 1], [1, 0]])
-        K2 = np.sqrt(p / 3) * np.array([[0, -1j], [1j, 0]])
-        K3 = np.sqrt(p / 3) * np.array([[1, 0], [0, -1]])
-        return [K0, K1, K2, K3]
+        K = cls.compute_kraus(*params)
+
+        # drop the Kraus matrices that vanish at the boundary values
+        if p == 0:
+            return K[:1].copy()
+
+        if p == 1:
+            return K[1:].copy()
+
+        return K
+
+    @classmethod
+    def compute_kraus(cls, *params, out=None):
+        p = _scalar_params(params)[0]
+        roots = (_sqrt(1 - p), _sqrt(p / 3))
+        return _run_kraus_kernel(_depolarizing_kraus, 4, roots, out)
+
+    @classmethod
+    def compute_kraus_batched(cls, *params):
+        p = np.asarray(params[0], dtype=np.float64)
+        roots = (np.sqrt(1 - p), np.sqrt(p / 3))
+        return _run_kraus_kernel_batched(_depolarizing_kraus_batched, 4, roots)
 
 
 __qubit_channels__ = {
@@ -14,6 +14,8 @@
 """
 Unit tests for the available built-in quantum channels.
 """
+import sys
+
 import pytest
 import functools
 import numpy as np
@@ -28,6 +30,28 @@ ch_list = [
 ]
 
 X = np.array([[0, 1], [1, 0]])
+Y = np.array([[0, -1j], [1j, 0]])
+Z = np.array([[1, 0], [0, -1]])
+
+
+def full_kraus(ops, p):
+    """Reference values for the full set of Kraus matrices of a channel,
+    with all channel parameters set to ``p``"""
+    if ops is channel.AmplitudeDamping:
+        return [np.diag([1, np.sqrt(1 - p)]), np.sqrt(p) * np.array([[0, 1], [0, 0]])]
+
+    if ops is channel.GeneralizedAmplitudeDamping:
+        return [
+            np.sqrt(p) * np.diag([1, np.sqrt(1 - p)]),
+            np.sqrt(p) * np.sqrt(p) * np.array([[0, 1], [0, 0]]),
+            np.sqrt(1 - p) * np.diag([np.sqrt(1 - p), 1]),
+            np.sqrt(1 - p) * np.sqrt(p) * np.array([[0, 0], [1, 0]]),
+        ]
+
+    if ops is channel.PhaseDamping:
+        return [np.diag([1, np.sqrt(1 - p)]), np.diag([0, np.sqrt(p)])]
+
+    return [np.sqrt(1 - p) * np.eye(2)] + [np.sqrt(p / 3) * P for P in (X, Y, Z)]
 
 
 class TestChannels:
@@ -46,6 +70,164 @@ class TestChannels:
         Kraus_sum = np.einsum("ajk,ajl->kl", K_arr.conj(), K_arr)
         assert np.allclose(Kraus_sum, np.eye(2), atol=tol, rtol=0)
 
+    @pytest.mark.parametrize("ops", ch_list)
+    def test_kraus_matrices_cached(self, ops):
+        """Test that Kraus matrices for scalar parameters are cached and read-only"""
+        params = [0.1] * ops.num_params
+        K_list = ops._kraus_matrices(*params)
+
+        assert ops._kraus_matrices_stacked(*params) is K_list[0].base
+        assert all(not K.flags.writeable for K in K_list)
+
+        with pytest.raises(ValueError, match="read-only"):
+            K_list[0][0, 0] = 0
+
+        with pytest.raises(ValueError, match="read-only"):
+            K_list[0].base[0, 0, 0] = 0
+
+    @pytest.mark.parametrize("ops", ch_list)
+    @pytest.mark.parametrize("p", [0, 0.1, 1])
+    def test_kraus_matrices_stacked(self, ops, p, tol):
+        """Test that the stacked Kraus matrices agree with the Kraus matrix list,
+        and that the list contains views into a single stacked array"""
+        params = [p] * ops.num_params
+        K_list = ops._kraus_matrices(*params)
+        res = ops._kraus_matrices_stacked(*params)
+
+        assert res.shape == (len(K_list), 2, 2)
+        assert np.allclose(res, K_list, atol=tol, rtol=0)
+        assert all(K.base is K_list[0].base for K in K_list)
+
+    @pytest.mark.parametrize("ops", ch_list)
+    def test_kraus_matrices_non_scalar(self, ops):
+        """Test that an error is raised if the Kraus matrices are requested
+        for a batch of parameter values"""
+        params = [np.array([0.1, 0.2])] * ops.num_params
+
+        with pytest.raises(ValueError, match="scalar parameters"):
+            ops._kraus_matrices_stacked(*params)
+
+        with pytest.raises(ValueError, match="scalar parameters"):
+            ops.compute_kraus(*params)
+
+    @pytest.mark.parametrize("ops", ch_list)
+    @pytest.mark.parametrize("p", [0, 0.1, 0.5, 1])
+    def test_compute_kraus(self, ops, p, tol):
+        """Test that compute_kraus returns the full, fixed-shape set of Kraus matrices,
+        including those that vanish at the boundary values"""
+        params = [p] * ops.num_params
+        expected = full_kraus(ops, p)
+        res = ops.compute_kraus(*params)
+
+        assert res.shape == (len(expected), 2, 2)
+        assert res.dtype == np.complex128
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("ops", ch_list)
+    def test_compute_kraus_out(self, ops, tol):
+        """Test that compute_kraus overwrites a provided output buffer"""
+        params = [0.1] * ops.num_params
+        n = len(ops._kraus_matrices(*params))
+        out = np.full((n, 2, 2), 5, dtype=np.complex128)
+        res = ops.compute_kraus(*params, out=out)
+
+        assert res is out
+        assert np.allclose(out, ops._kraus_matrices(*params), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "out",
+        [
+            np.empty((3, 2, 2), dtype=np.complex128),
+            np.empty((4, 2, 2), dtype=np.float64),
+            np.empty((4, 2, 4), dtype=np.complex128)[:, :, ::2],
+        ],
+    )
+    def test_compute_kraus_invalid_out(self, out):
+        """Test that compute_kraus raises an error if the output buffer has the wrong
+        shape or dtype, or is not C-contiguous"""
+        with pytest.raises(ValueError, match="must be a C-contiguous complex128 array"):
+            channel.DepolarizingChannel.compute_kraus(0.3, out=out)
+
+    @pytest.mark.parametrize(
+        "ops, kernel",
+        [
+            (channel.AmplitudeDamping, channel._amplitude_damping_kraus),
+            (channel.GeneralizedAmplitudeDamping, channel._generalized_amplitude_damping_kraus),
+            (channel.PhaseDamping, channel._phase_damping_kraus),
+            (channel.DepolarizingChannel, channel._depolarizing_kraus),
+        ],
+    )
+    def test_compute_kraus_numba(self, ops, kernel, tol):
+        """Test that compute_kraus uses a JIT-compiled kernel if Numba is installed"""
+        numba = pytest.importorskip("numba")
+        channel._jit.cache_clear()
+
+        res = ops.compute_kraus(*[0.3] * ops.num_params)
+
+        jitted = channel._jit(kernel)
+        assert isinstance(jitted, numba.core.dispatcher.Dispatcher)
+        assert jitted.signatures
+        assert np.allclose(res, full_kraus(ops, 0.3), atol=tol, rtol=0)
+
+    def test_compute_kraus_without_numba(self, monkeypatch, tol):
+        """Test that compute_kraus falls back to NumPy if Numba is not installed"""
+        channel._jit.cache_clear()
+
+        with monkeypatch.context() as m:
+            m.setitem(sys.modules, "numba", None)
+            res = channel.DepolarizingChannel.compute_kraus(0.3)
+            kernel = channel._jit(channel._depolarizing_kraus)
+
+        channel._jit.cache_clear()
+        assert kernel is channel._depolarizing_kraus
+        assert np.allclose(res, channel.DepolarizingChannel._kraus_matrices(0.3), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("ops", ch_list)
+    def test_compute_kraus_batched(self, ops, tol):
+        """Test that the batched Kraus matrices agree with the full set of
+        Kraus matrices for each parameter value in the batch"""
+        batch = np.array([0, 0.1, 0.5, 1])
+        params = [batch] * ops.num_params
+        res = ops.compute_kraus_batched(*params)
+        expected = np.array([full_kraus(ops, p) for p in batch])
+
+        assert res.shape == (len(batch),) + expected[0].shape
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        res = ops.compute_kraus_batched(*[np.zeros((0, 3))] * ops.num_params)
+        assert res.shape == (0, 3) + expected[0].shape
+
+    @pytest.mark.parametrize("ops", ch_list)
+    @pytest.mark.parametrize("p", [np.float32(0.3), np.float16(0.5)])
+    def test_numpy_scalar_parameters(self, ops, p, tol):
+        """Test that NumPy scalar parameters give the same Kraus matrices as Python floats"""
+        params = [p] * ops.num_params
+        expected = ops._kraus_matrices(*[float(p)] * ops.num_params)
+        assert np.allclose(ops._kraus_matrices(*params), expected, atol=1e-6, rtol=0)
+
+    @pytest.mark.parametrize(
+        "ops", [channel.AmplitudeDamping, channel.PhaseDamping, channel.DepolarizingChannel]
+    )
+    @pytest.mark.parametrize("p", [0, 0.0, np.float32(0), np.int64(0), np.array(0.0)])
+    def test_boundary_value_types(self, ops, p):
+        """Test that vanishing Kraus matrices are omitted at zero for all scalar parameter types"""
+        assert len(ops._kraus_matrices(p)) == 1
+
+    @pytest.mark.parametrize("p", [1, 1.0, np.float32(1), np.int64(1), np.array(1.0)])
+    def test_depolarizing_one_types(self, p):
+        """Test that the identity Kraus matrix is omitted from DepolarizingChannel at one
+        for all scalar parameter types"""
+        assert len(channel.DepolarizingChannel._kraus_matrices(p)) == 3
+
+    @pytest.mark.parametrize("ops", ch_list)
+    def test_out_of_range_parameters(self, ops):
+        """Test that out-of-range parameters passed directly to _kraus_matrices
+        give nan entries rather than an error"""
+        with np.errstate(invalid="ignore"):
+            K_list = ops._kraus_matrices(*[1.2] * ops.num_params)
+
+        assert np.any(np.isnan(K_list))
+
     @pytest.mark.parametrize("ops", ch_list)
     @pytest.mark.parametrize("p", [1.5])
     def test_valid_input(self, ops, p):
@@ -64,8 +246,9 @@ class TestAmplitudeDamping:
     def test_gamma_zero(self, tol):
         """Test gamma=0 gives correct Kraus matrices"""
         op = channel.AmplitudeDamping
+        assert len(op(0, wires=0).kraus_matrices) == 1
         assert np.allclose(op(0, wires=0).kraus_matrices[0], np.eye(2), atol=tol, rtol=0)
-        assert np.allclose(op(0, wires=0).kraus_matrices[1], np.zeros((2, 2)), atol=tol, rtol=0)
+        assert np.allclose(op.compute_kraus(0)[1], np.zeros((2, 2)), atol=tol, rtol=0)
 
     def test_gamma_arbitrary(self, tol):
         """Test gamma=0.1 gives correct Kraus matrices"""
@@ -105,8 +288,9 @@ class TestPhaseDamping:
     def test_gamma_zero(self, tol):
         """Test gamma=0 gives correct Kraus matrices"""
         op = channel.PhaseDamping
+        assert len(op(0, wires=0).kraus_matrices) == 1
         assert np.allclose(op(0, wires=0).kraus_matrices[0], np.eye(2), atol=tol, rtol=0)
-        assert np.allclose(op(0, wires=0).kraus_matrices[1], np.zeros((2, 2)), atol=tol, rtol=0)
+        assert np.allclose(op.compute_kraus(0)[1], np.zeros((2, 2)), atol=tol, rtol=0)
 
     def test_gamma_arbitrary(self, tol):
         """Test gamma=0.1 gives correct Kraus matrices"""
@@ -124,8 +308,18 @@ class TestDepolarizingChannel:
     def test_p_zero(self, tol):
         """Test p=0 gives correct Kraus matrices"""
         op = channel.DepolarizingChannel
+        assert len(op(0, wires=0).kraus_matrices) == 1
         assert np.allclose(op(0, wires=0).kraus_matrices[0], np.eye(2), atol=tol, rtol=0)
-        assert np.allclose(op(0, wires=0).kraus_matrices[1], np.zeros((2, 2)), atol=tol, rtol=0)
+        assert np.allclose(op.compute_kraus(0)[1], np.zeros((2, 2)), atol=tol, rtol=0)
+
+    def test_p_one(self, tol):
+        """Test p=1 gives correct Kraus matrices"""
+        op = channel.DepolarizingChannel
+        K_list = op(1, wires=0).kraus_matrices
+        assert len(K_list) == 3
+        assert np.allclose(K_list[0], np.sqrt(1 / 3) * X, atol=tol, rtol=0)
+        assert np.allclose(K_list[1], np.sqrt(1 / 3) * Y, atol=tol, rtol=0)
+        assert np.allclose(K_list[2], np.sqrt(1 / 3) * Z, atol=tol, rtol=0)
 
     def test_p_arbitrary(self, tol):
         """Test p=0.1 gives correct Kraus matrices"""
@@ -1352,6 +1352,45 @@ class TestChannel:
         op = DummyOp(0.1, wires=0)
         assert np.all(op.kraus_matrices[0] == expected)
 
+    def test_kraus_matrices_stacked(self):
+        """Test that the default stacked Kraus matrices are built from the Kraus matrix list"""
+        class DummyOp(qml.operation.Channel):
+            r"""Dummy custom channel"""
+            num_wires = 1
+            num_params = 1
+            par_domain = "R"
+            grad_method = "F"
+
+            @classmethod
+            def _kraus_matrices(cls, *params):
+                p = params[0]
+                K1 = np.sqrt(p) * X
+                K2 = np.sqrt(1-p) * I
+                return [K1, K2]
+
+        res = DummyOp._kraus_matrices_stacked(0.1)
+        assert res.shape == (2, 2, 2)
+        assert np.all(res == np.array(DummyOp._kraus_matrices(0.1)))
+
+        res = DummyOp.compute_kraus(0.1)
+        assert res.dtype == np.complex128
+        assert np.all(res == np.array(DummyOp._kraus_matrices(0.1)))
+
+        out = np.empty((2, 2, 2), dtype=np.complex128)
+        assert DummyOp.compute_kraus(0.1, out=out) is out
+        assert np.all(out == res)
+
+        with pytest.raises(ValueError, match="must be a C-contiguous complex128 array"):
+            DummyOp.compute_kraus(0.1, out=np.empty((3, 2, 2), dtype=np.complex128))
+
+        res = DummyOp.compute_kraus_batched([[0.1, 0.2, 0.3]])
+        assert res.shape == (1, 3, 2, 2, 2)
+        assert np.allclose(res[0, 1], DummyOp.compute_kraus(0.2))
+
+        res = DummyOp.compute_kraus_batched(np.zeros((0, 3)))
+        assert res.shape == (0, 3, 2, 2, 2)
+        assert res.dtype == np.complex128
+
     def test_grad_method(self):
         """Test that an exception is raised if a gradient method is set to analytic
         as only finite difference or ``None`` is allowed at the moment. This can be updated